@@ -1 +1,13 @@
 # Web engine wrapper for QWebEngineView
+from typing import Optional
+
+from PyQt6.QtCore import QUrl
+
+def create_web_view(url: Optional[QUrl] = None):
+    """Create a web view, optionally loading the given URL"""
+    # Imported here so QtWebEngine (Chromium) only loads when a view is built
+    from PyQt6.QtWebEngineWidgets import QWebEngineView
+    view = QWebEngineView()
+    if url is not None:
+        view.setUrl(url)
+    return view
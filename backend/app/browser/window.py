@@ -5,14 +5,23 @@ from PyQt6.QtWidgets import (
     QWidget, QLineEdit, QPushButton, QTabWidget, QToolBar,
     QStatusBar, QMenuBar, QMessageBox, QSplashScreen
 )
-from PyQt6.QtCore import Qt, QUrl, QTimer, pyqtSignal
+from PyQt6.QtCore import Qt, QCoreApplication, QUrl, QTimer, pyqtSignal
 from PyQt6.QtGui import QIcon, QPixmap, QAction, QFont
-from PyQt6.QtWebEngineWidgets import QWebEngineView
-from typing import Optional
+from typing import Final, Optional
+from urllib.parse import quote_plus
 import os
 
 # Import our custom modules
 from ..utils.logger import logger, ErrorHandler, BrowserError, NavigationError
+from .engine import create_web_view
+
+# Home page, also used as the default page (QUrl needs no QApplication)
+HOME_URL_STR: Final[str] = "https://www.google.com"
+HOME_QURL: Final = QUrl(HOME_URL_STR)
+
+# URL prefixes accepted as-is by the address bar
+_URL_SCHEMES: Final = ("http://", "https://")
+_SEARCH_TEMPLATE: Final = "https://www.google.com/search?q={}".format
 
 class BrowserWindow(QMainWindow):
     """Main browser window class with PyQt6"""
@@ -21,9 +30,20 @@ class BrowserWindow(QMainWindow):
     url_changed = pyqtSignal(str)
     page_loaded = pyqtSignal(str)
     
+    # Window icon loaded by the first window; a null QIcon when no icon file exists
+    _cached_icon: Optional[QIcon] = None
+    
     def __init__(self):
         super().__init__()
         
+        # Pending UI updates, flushed once per event loop pass
+        self._pending_url: Optional[str] = None
+        self._pending_status: Optional[tuple] = None
+        self._flush_pending = False
+        
+        # Last URL reported by the web view, reused instead of querying it again
+        self._last_url = ""
+        
         try:
             logger.info("Initializing browser window")
             self._init_ui()
@@ -74,180 +94,158 @@ class BrowserWindow(QMainWindow):
     
     def _set_window_icon(self):
         """Set window icon if available"""
-        try:
+        if BrowserWindow._cached_icon is None:
             icon_path = os.path.join(os.path.dirname(__file__), "..", "..", "assets", "icon.png")
             if os.path.exists(icon_path):
-                self.setWindowIcon(QIcon(icon_path))
-                logger.debug(f"Window icon set from {icon_path}")
-        except Exception as e:
-            logger.warning("Could not set window icon", exception=e)
+                BrowserWindow._cached_icon = QIcon(icon_path)
+                logger.debug("Window icon loaded from %s", icon_path)
+            else:
+                BrowserWindow._cached_icon = QIcon()
+        
+        if not BrowserWindow._cached_icon.isNull():
+            self.setWindowIcon(BrowserWindow._cached_icon)
     
     def _create_menu_bar(self):
         """Create application menu bar"""
-        try:
-            menubar = self.menuBar()
-            
-            # File menu
-            file_menu = menubar.addMenu('&File')
-            
-            new_tab_action = QAction('&New Tab', self)
-            new_tab_action.setShortcut('Ctrl+T')
-            new_tab_action.triggered.connect(self._new_tab)
-            file_menu.addAction(new_tab_action)
-            
-            close_tab_action = QAction('&Close Tab', self)
-            close_tab_action.setShortcut('Ctrl+W')
-            close_tab_action.triggered.connect(self._close_current_tab)
-            file_menu.addAction(close_tab_action)
-            
-            file_menu.addSeparator()
-            
-            exit_action = QAction('&Exit', self)
-            exit_action.setShortcut('Ctrl+Q')
-            exit_action.triggered.connect(self.close)
-            file_menu.addAction(exit_action)
-            
-            # Edit menu
-            edit_menu = menubar.addMenu('&Edit')
-            
-            # View menu
-            view_menu = menubar.addMenu('&View')
-            
-            # Tools menu
-            tools_menu = menubar.addMenu('&Tools')
-            
-            # Help menu
-            help_menu = menubar.addMenu('&Help')
-            
-            about_action = QAction('&About', self)
-            about_action.triggered.connect(self._show_about)
-            help_menu.addAction(about_action)
-            
-            logger.debug("Menu bar created successfully")
-            
-        except Exception as e:
-            logger.error("Error creating menu bar", exception=e)
+        menubar = self.menuBar()
+        
+        # File menu
+        file_menu = menubar.addMenu('&File')
+        
+        new_tab_action = QAction('&New Tab', self)
+        new_tab_action.setShortcut('Ctrl+T')
+        new_tab_action.triggered.connect(self._new_tab)
+        file_menu.addAction(new_tab_action)
+        
+        close_tab_action = QAction('&Close Tab', self)
+        close_tab_action.setShortcut('Ctrl+W')
+        close_tab_action.triggered.connect(self._close_current_tab)
+        file_menu.addAction(close_tab_action)
+        
+        file_menu.addSeparator()
+        
+        exit_action = QAction('&Exit', self)
+        exit_action.setShortcut('Ctrl+Q')
+        exit_action.triggered.connect(self.close)
+        file_menu.addAction(exit_action)
+        
+        # Edit menu
+        edit_menu = menubar.addMenu('&Edit')
+        
+        # View menu
+        view_menu = menubar.addMenu('&View')
+        
+        # Tools menu
+        tools_menu = menubar.addMenu('&Tools')
+        
+        # Help menu
+        help_menu = menubar.addMenu('&Help')
+        
+        about_action = QAction('&About', self)
+        about_action.triggered.connect(self._show_about)
+        help_menu.addAction(about_action)
+        
+        logger.debug("Menu bar created successfully")
     
     def _create_toolbar(self):
         """Create navigation toolbar"""
-        try:
-            self.toolbar = QToolBar()
-            self.toolbar.setMovable(False)
-            self.addToolBar(self.toolbar)
-            
-            # Back button
-            self.back_btn = QPushButton("←")
-            self.back_btn.setMaximumWidth(40)
-            self.back_btn.setToolTip("Go back")
-            self.back_btn.clicked.connect(self._go_back)
-            self.toolbar.addWidget(self.back_btn)
-            
-            # Forward button
-            self.forward_btn = QPushButton("→")
-            self.forward_btn.setMaximumWidth(40)
-            self.forward_btn.setToolTip("Go forward")
-            self.forward_btn.clicked.connect(self._go_forward)
-            self.toolbar.addWidget(self.forward_btn)
-            
-            # Refresh button
-            self.refresh_btn = QPushButton("⟳")
-            self.refresh_btn.setMaximumWidth(40)
-            self.refresh_btn.setToolTip("Refresh page")
-            self.refresh_btn.clicked.connect(self._refresh_page)
-            self.toolbar.addWidget(self.refresh_btn)
-            
-            # Home button
-            self.home_btn = QPushButton("🏠")
-            self.home_btn.setMaximumWidth(40)
-            self.home_btn.setToolTip("Go home")
-            self.home_btn.clicked.connect(self._go_home)
-            self.toolbar.addWidget(self.home_btn)
-            
-            logger.debug("Toolbar created successfully")
-            
-        except Exception as e:
-            logger.error("Error creating toolbar", exception=e)
+        self.toolbar = QToolBar()
+        self.toolbar.setMovable(False)
+        self.addToolBar(self.toolbar)
+        
+        # Back action
+        self.back_action = QAction("←", self)
+        self.back_action.setToolTip("Go back")
+        self.back_action.triggered.connect(self._go_back)
+        self.toolbar.addAction(self.back_action)
+        
+        # Forward action
+        self.forward_action = QAction("→", self)
+        self.forward_action.setToolTip("Go forward")
+        self.forward_action.triggered.connect(self._go_forward)
+        self.toolbar.addAction(self.forward_action)
+        
+        # Refresh action
+        self.refresh_action = QAction("⟳", self)
+        self.refresh_action.setToolTip("Refresh page")
+        self.refresh_action.triggered.connect(self._refresh_page)
+        self.toolbar.addAction(self.refresh_action)
+        
+        # Home action
+        self.home_action = QAction("🏠", self)
+        self.home_action.setToolTip("Go home")
+        self.home_action.triggered.connect(self._go_home)
+        self.toolbar.addAction(self.home_action)
+        
+        logger.debug("Toolbar created successfully")
     
     def _create_address_bar(self):
         """Create address bar widget"""
-        try:
-            self.address_widget = QWidget()
-            address_layout = QHBoxLayout(self.address_widget)
-            address_layout.setContentsMargins(5, 5, 5, 5)
-            
-            # Address bar
-            self.address_bar = QLineEdit()
-            self.address_bar.setPlaceholderText("Enter URL or search...")
-            self.address_bar.returnPressed.connect(self._navigate_to_url)
-            address_layout.addWidget(self.address_bar)
-            
-            # Go button
-            self.go_btn = QPushButton("Go")
-            self.go_btn.setMaximumWidth(50)
-            self.go_btn.clicked.connect(self._navigate_to_url)
-            address_layout.addWidget(self.go_btn)
-            
-            logger.debug("Address bar created successfully")
-            
-        except Exception as e:
-            logger.error("Error creating address bar", exception=e)
+        self.address_widget = QWidget()
+        address_layout = QHBoxLayout(self.address_widget)
+        address_layout.setContentsMargins(5, 5, 5, 5)
+        
+        # Address bar
+        self.address_bar = QLineEdit()
+        self.address_bar.setPlaceholderText("Enter URL or search...")
+        self.address_bar.returnPressed.connect(self._navigate_to_url)
+        address_layout.addWidget(self.address_bar)
+        
+        # Go button
+        self.go_btn = QPushButton("Go")
+        self.go_btn.setMaximumWidth(50)
+        self.go_btn.clicked.connect(self._navigate_to_url)
+        address_layout.addWidget(self.go_btn)
+        
+        logger.debug("Address bar created successfully")
     
     def _create_web_view(self):
         """Create web engine view"""
-        try:
-            self.web_view = QWebEngineView()
-            
-            # Load default page
-            self.web_view.setUrl(QUrl("https://www.google.com"))
-            
-            logger.debug("Web view created successfully")
-            
-        except Exception as e:
-            logger.error("Error creating web view", exception=e)
-            raise BrowserError("Failed to create web engine view") from e
+        # Load default page
+        self.web_view = create_web_view(HOME_QURL)
+        # Seed the URL once; urlChanged for this first load fires before slots are connected
+        self._last_url = self.web_view.url().toString()
+        
+        logger.debug("Web view created successfully")
     
     def _create_status_bar(self):
         """Create status bar"""
-        try:
-            self.status_bar = QStatusBar()
-            self.setStatusBar(self.status_bar)
-            self.status_bar.showMessage("Ready", 2000)
-            
-            logger.debug("Status bar created successfully")
-            
-        except Exception as e:
-            logger.error("Error creating status bar", exception=e)
+        self.status_bar = QStatusBar()
+        self.setStatusBar(self.status_bar)
+        self.status_bar.showMessage("Ready", 2000)
+        
+        logger.debug("Status bar created successfully")
     
     def _setup_connections(self):
         """Setup signal-slot connections"""
-        try:
-            # Web view signals
-            self.web_view.urlChanged.connect(self._on_url_changed)
-            self.web_view.loadFinished.connect(self._on_load_finished)
-            self.web_view.loadStarted.connect(self._on_load_started)
-            
-            logger.debug("Signal connections setup successfully")
-            
-        except Exception as e:
-            logger.error("Error setting up connections", exception=e)
+        # Web view signals; queued so slot work runs after pending events such as paints
+        queued = Qt.ConnectionType.QueuedConnection
+        self.web_view.urlChanged.connect(self._on_url_changed, queued)
+        self.web_view.loadFinished.connect(self._on_load_finished, queued)
+        self.web_view.loadStarted.connect(self._on_load_started, queued)
+        
+        logger.debug("Signal connections setup successfully")
     
     @ErrorHandler.handle_exception
     def _navigate_to_url(self):
         """Navigate to URL from address bar"""
         try:
-            url = self.address_bar.text().strip()
+            url = self.address_bar.text()
+            # Only allocate a stripped copy when there is surrounding whitespace
+            if url[:1].isspace() or url[-1:].isspace():
+                url = url.strip()
             if not url:
                 return
             
             # Add protocol if missing
-            if not url.startswith(('http://', 'https://')):
+            if not url.startswith(_URL_SCHEMES):
                 if '.' in url:
                     url = 'https://' + url
                 else:
                     # Treat as search query
-                    url = f"https://www.google.com/search?q={url}"
+                    url = _SEARCH_TEMPLATE(quote_plus(url))
             
-            logger.info(f"Navigating to: {url}")
+            logger.info("Navigating to: %s", url)
             self.web_view.setUrl(QUrl(url))
             self.status_bar.showMessage(f"Loading {url}...", 5000)
             
@@ -278,8 +276,7 @@ class BrowserWindow(QMainWindow):
     @ErrorHandler.handle_exception
     def _go_home(self):
         """Go to home page"""
-        home_url = "https://www.google.com"
-        self.web_view.setUrl(QUrl(home_url))
+        self.web_view.setUrl(HOME_QURL)
         logger.debug("Navigated to home page")
     
     def _new_tab(self):
@@ -292,25 +289,50 @@ class BrowserWindow(QMainWindow):
         logger.info("Close tab requested (not implemented yet)")
         self.status_bar.showMessage("Close tab feature coming soon!", 3000)
     
+    def _schedule_ui_flush(self):
+        """Schedule a single flush of pending UI updates when the event loop is idle"""
+        if not self._flush_pending:
+            self._flush_pending = True
+            QTimer.singleShot(0, self._flush_ui_updates)
+    
+    def _flush_ui_updates(self):
+        """Apply the latest pending address bar and status bar updates"""
+        self._flush_pending = False
+        
+        if self._pending_url is not None:
+            url_str = self._pending_url
+            self._pending_url = None
+            self.address_bar.setText(url_str)
+            self.url_changed.emit(url_str)
+        
+        if self._pending_status is not None:
+            message, timeout = self._pending_status
+            self._pending_status = None
+            self.status_bar.showMessage(message, timeout)
+    
     def _on_url_changed(self, url):
         """Handle URL change"""
         url_str = url.toString()
-        self.address_bar.setText(url_str)
-        self.url_changed.emit(url_str)
-        logger.debug(f"URL changed to: {url_str}")
+        self._last_url = url_str
+        self._pending_url = url_str
+        self._schedule_ui_flush()
+        logger.debug("URL changed to: %s", url_str)
     
     def _on_load_started(self):
         """Handle page load start"""
-        self.status_bar.showMessage("Loading...", 0)
+        self._pending_status = ("Loading...", 0)
+        self._schedule_ui_flush()
         logger.debug("Page load started")
     
     def _on_load_finished(self, success):
         """Handle page load completion"""
+        # Drop any queued "Loading..." message so it cannot overwrite the result
+        self._pending_status = None
         if success:
             self.status_bar.showMessage("Page loaded", 2000)
-            current_url = self.web_view.url().toString()
+            current_url = self._last_url
             self.page_loaded.emit(current_url)
-            logger.info(f"Page loaded successfully: {current_url}")
+            logger.info("Page loaded successfully: %s", current_url)
         else:
             self.status_bar.showMessage("Failed to load page", 5000)
             logger.warning("Page failed to load")
@@ -328,16 +350,14 @@ class BrowserWindow(QMainWindow):
     
     def closeEvent(self, event):
         """Handle window close event"""
-        try:
-            logger.info("Browser window closing")
-            event.accept()
-        except Exception as e:
-            logger.error("Error during window close", exception=e)
-            event.accept()
+        logger.info("Browser window closing")
+        event.accept()
 
 def create_application() -> QApplication:
     """Create and configure QApplication"""
     try:
+        # Required by QtWebEngine when it is imported after QApplication is created
+        QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
         app = QApplication(sys.argv)
         app.setApplicationName("AI-Powered Browser")
         app.setApplicationVersion("1.0")
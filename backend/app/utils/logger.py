@@ -1,9 +1,37 @@
+import atexit
+import copy
+import functools
 import logging
 import logging.handlers
 import os
+import queue
 from datetime import datetime
 from typing import Optional
-import traceback
+
+# Log file date stamp and directory, resolved once at import
+_TODAY = datetime.now().strftime('%Y%m%d')
+_LOG_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', '..', 'logs'))
+os.makedirs(_LOG_DIR, exist_ok=True)
+
+# Formatters shared by every logger's handlers
+_DETAILED_FMT = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
+)
+_SIMPLE_FMT = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+
+def _exc_info(exception: BaseException) -> tuple:
+    """Build an exc_info tuple so logging formats the traceback only when emitted"""
+    return (type(exception), exception, exception.__traceback__)
+
+class _MessageQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that snapshots the message but keeps exc_info for the file formatters"""
+    
+    def prepare(self, record):
+        # Resolve msg % args now so later mutation of args cannot change the logged text
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
 class BrowserLogger:
     """Centralized logging system for the AI-powered browser"""
@@ -12,98 +40,128 @@ class BrowserLogger:
         self.logger = logging.getLogger(name)
         self.logger.setLevel(getattr(logging, log_level.upper()))
         
-        # Prevent duplicate handlers
-        if not self.logger.handlers:
-            self._setup_handlers()
+        # Handlers already attached, nothing else to set up
+        if self.logger.handlers:
+            return
+        self._setup_handlers()
     
     def _setup_handlers(self):
         """Setup file and console handlers"""
-        # Create logs directory if it doesn't exist
-        log_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'logs')
-        os.makedirs(log_dir, exist_ok=True)
-        
         # Console handler
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
         
         # File handler with rotation
-        log_file = os.path.join(log_dir, f"browser_{datetime.now().strftime('%Y%m%d')}.log")
+        log_file = os.path.join(_LOG_DIR, f"browser_{_TODAY}.log")
         file_handler = logging.handlers.RotatingFileHandler(
             log_file, maxBytes=10*1024*1024, backupCount=5
         )
         file_handler.setLevel(logging.DEBUG)
         
         # Error log handler
-        error_file = os.path.join(log_dir, f"error_{datetime.now().strftime('%Y%m%d')}.log")
+        error_file = os.path.join(_LOG_DIR, f"error_{_TODAY}.log")
         error_handler = logging.handlers.RotatingFileHandler(
             error_file, maxBytes=5*1024*1024, backupCount=3
         )
         error_handler.setLevel(logging.ERROR)
         
-        # Formatters
-        detailed_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
-        )
-        simple_formatter = logging.Formatter(
-            '%(asctime)s - %(levelname)s - %(message)s'
-        )
-        
         # Apply formatters
-        console_handler.setFormatter(simple_formatter)
-        file_handler.setFormatter(detailed_formatter)
-        error_handler.setFormatter(detailed_formatter)
+        console_handler.setFormatter(_SIMPLE_FMT)
+        file_handler.setFormatter(_DETAILED_FMT)
+        error_handler.setFormatter(_DETAILED_FMT)
+        
+        # Buffer the main log file and write it in batches (immediately on errors)
+        self._buffered_file_handler = logging.handlers.MemoryHandler(
+            capacity=256, flushLevel=logging.ERROR, target=file_handler, flushOnClose=True
+        )
+        # MemoryHandler.flush bypasses the target's level, so filter here
+        self._buffered_file_handler.setLevel(file_handler.level)
         
-        # Add handlers
+        # Add handlers; file writes happen on a background listener thread
         self.logger.addHandler(console_handler)
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(error_handler)
+        self._queue = queue.SimpleQueue()
+        self.logger.addHandler(_MessageQueueHandler(self._queue))
+        self._listener = logging.handlers.QueueListener(
+            self._queue, self._buffered_file_handler, error_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        self._listener_stopped = False
+        atexit.register(self._shutdown_handlers)
+    
+    def _shutdown_handlers(self):
+        """Drain the log queue, then flush buffered file records"""
+        # QueueListener.stop() fails if called twice on older Pythons
+        if not self._listener_stopped:
+            self._listener.stop()
+            self._listener_stopped = True
+        self._buffered_file_handler.flush()
     
-    def info(self, message: str, extra: Optional[dict] = None):
-        """Log info message"""
-        self.logger.info(message, extra=extra)
+    def info(self, message: str, *args, extra: Optional[dict] = None):
+        """Log info message with optional %-style args"""
+        self.logger.info(message, *args, extra=extra)
     
-    def debug(self, message: str, extra: Optional[dict] = None):
-        """Log debug message"""
-        self.logger.debug(message, extra=extra)
+    def debug(self, message: str, *args, extra: Optional[dict] = None):
+        """Log debug message, formatting %-style args only when DEBUG is enabled"""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(message, *args, extra=extra)
     
-    def warning(self, message: str, extra: Optional[dict] = None):
-        """Log warning message"""
-        self.logger.warning(message, extra=extra)
+    def warning(self, message: str, *args, extra: Optional[dict] = None):
+        """Log warning message with optional %-style args"""
+        self.logger.warning(message, *args, extra=extra)
     
-    def error(self, message: str, exception: Optional[Exception] = None, extra: Optional[dict] = None):
-        """Log error message with optional exception details"""
-        if exception:
-            error_msg = f"{message}: {str(exception)}\n{traceback.format_exc()}"
+    def error(self, message: str, *args, exception: Optional[Exception] = None, extra: Optional[dict] = None):
+        """Log error message with optional exception details (traceback formatted lazily)
+        
+        The exception must be passed by keyword: positional args are %-style
+        message args, so logger.error("msg", exc) no longer logs exc's traceback.
+        """
+        if exception is not None:
+            self.logger.error(message, *args, exc_info=_exc_info(exception), extra=extra)
         else:
-            error_msg = message
-        self.logger.error(error_msg, extra=extra)
+            self.logger.error(message, *args, extra=extra)
     
-    def critical(self, message: str, exception: Optional[Exception] = None, extra: Optional[dict] = None):
-        """Log critical message with optional exception details"""
-        if exception:
-            error_msg = f"{message}: {str(exception)}\n{traceback.format_exc()}"
+    def critical(self, message: str, *args, exception: Optional[Exception] = None, extra: Optional[dict] = None):
+        """Log critical message with optional exception details (traceback formatted lazily)
+        
+        The exception must be passed by keyword: positional args are %-style
+        message args, so logger.critical("msg", exc) no longer logs exc's traceback.
+        """
+        if exception is not None:
+            self.logger.critical(message, *args, exc_info=_exc_info(exception), extra=extra)
         else:
-            error_msg = message
-        self.logger.critical(error_msg, extra=extra)
+            self.logger.critical(message, *args, extra=extra)
 
-# Global logger instance
-logger = BrowserLogger()
+# Logger instances by name, so repeated lookups reuse the same object
+_LOGGER_CACHE: dict[str, BrowserLogger] = {}
 
 def get_logger(name: str = "ai_browser") -> BrowserLogger:
-    """Get logger instance"""
-    return BrowserLogger(name)
+    """Get cached logger instance"""
+    cached = _LOGGER_CACHE.get(name)
+    if cached is None:
+        cached = _LOGGER_CACHE[name] = BrowserLogger(name)
+    return cached
+
+# Global logger instance
+logger = get_logger()
 
 class ErrorHandler:
     """Error handling utilities"""
     
     @staticmethod
     def handle_exception(func):
-        """Decorator for handling exceptions in functions"""
+        """Decorator for handling exceptions in functions
+        
+        Set PYSCRAPE_NO_GUARD to return functions unwrapped.
+        """
+        if os.environ.get("PYSCRAPE_NO_GUARD"):
+            return func
+        
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                logger.error(f"Error in {func.__name__}", exception=e)
+                logger.error("Error in %s", func.__name__, exception=e)
                 raise
         return wrapper
     
@@ -114,7 +172,7 @@ class ErrorHandler:
             return func()
         except Exception as e:
             if log_errors:
-                logger.error(f"Safe execution failed for {func.__name__ if hasattr(func, '__name__') else 'anonymous function'}", exception=e)
+                logger.error("Safe execution failed for %s", getattr(func, '__name__', 'anonymous function'), exception=e)
             return default_return
     
     @staticmethod
@@ -0,0 +1,108 @@
+# Tests for logging utilities
+import itertools
+import os
+import time
+
+import pytest
+
+from app.utils import logger as logger_module
+from app.utils.logger import BrowserLogger, get_logger
+
+_names = itertools.count()
+
+def _read(path):
+    if not os.path.exists(path):
+        return ""
+    with open(path) as f:
+        return f.read()
+
+def _wait_for(path, text, timeout=2.0):
+    """Poll a log file until text appears, since the listener writes on its own thread"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if text in _read(path):
+            return True
+        time.sleep(0.01)
+    return False
+
+def _close(log):
+    """Stop a test logger's listener and detach its handlers"""
+    log._shutdown_handlers()
+    for handler in list(log.logger.handlers):
+        log.logger.removeHandler(handler)
+        handler.close()
+
+@pytest.fixture
+def browser_logger(tmp_path, monkeypatch):
+    """BrowserLogger with a unique name writing into a temporary log directory"""
+    monkeypatch.setattr(logger_module, "_LOG_DIR", str(tmp_path))
+    log = BrowserLogger(f"test_logger_{next(_names)}")
+    yield log
+    _close(log)
+
+def _log_files(tmp_path):
+    today = logger_module._TODAY
+    return (
+        os.path.join(tmp_path, f"browser_{today}.log"),
+        os.path.join(tmp_path, f"error_{today}.log"),
+    )
+
+def test_get_logger_returns_cached_instance(tmp_path, monkeypatch):
+    monkeypatch.setattr(logger_module, "_LOG_DIR", str(tmp_path))
+    name = f"test_cache_{next(_names)}"
+    log = get_logger(name)
+    try:
+        assert get_logger(name) is log
+        assert get_logger() is logger_module.logger
+    finally:
+        logger_module._LOGGER_CACHE.pop(name, None)
+        _close(log)
+
+def test_args_and_exception_reach_file_handler(browser_logger, tmp_path):
+    browser_log, error_log = _log_files(tmp_path)
+    try:
+        1 / 0
+    except ZeroDivisionError as e:
+        browser_logger.error("Failed on %s", "page", exception=e)
+    browser_logger.info("Navigating to: %s", "https://example.com")
+    browser_logger._shutdown_handlers()
+
+    content = _read(browser_log)
+    assert "Navigating to: https://example.com" in content
+    assert "Failed on page" in content
+    assert "ZeroDivisionError: division by zero" in content
+    assert "ZeroDivisionError: division by zero" in _read(error_log)
+
+def test_error_records_flush_immediately(browser_logger, tmp_path):
+    browser_log, error_log = _log_files(tmp_path)
+    browser_logger.info("buffered before error")
+    browser_logger.error("something broke")
+
+    # Neither log is written by shutdown here; the ERROR record flushes on its own
+    assert _wait_for(error_log, "something broke")
+    assert _wait_for(browser_log, "something broke")
+    assert "buffered before error" in _read(browser_log)
+
+def test_shutdown_drains_buffered_records(browser_logger, tmp_path):
+    browser_log, _ = _log_files(tmp_path)
+    browser_logger.info("still buffered")
+    buffered = browser_logger._buffered_file_handler
+    deadline = time.monotonic() + 2.0
+    while not buffered.buffer and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert [record.getMessage() for record in buffered.buffer] == ["still buffered"]
+    assert "still buffered" not in _read(browser_log)
+
+    browser_logger._shutdown_handlers()
+    assert "still buffered" in _read(browser_log)
+
+def test_message_args_snapshotted_at_log_time(browser_logger, tmp_path):
+    browser_log, _ = _log_files(tmp_path)
+    state = {"url": "https://a.example"}
+    browser_logger.info("state at log time: %s", state)
+    state["url"] = "https://mutated.example"
+    browser_logger._shutdown_handlers()
+
+    content = _read(browser_log)
+    assert "https://a.example" in content
+    assert "mutated" not in content